@@ -22,7 +22,8 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/moabukar/devops-interview-prep",
-    packages=find_packages(),
+    package_dir={"": "src"},
+    packages=find_packages(where="src"),
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -41,7 +42,7 @@ setup(
     install_requires=requirements,
     entry_points={
         "console_scripts": [
-            "devops-ip=devops_ip.cli:cli",
+            "devops-ip=devops_interview_prep.cli:cli",
         ],
     },
     keywords="devops, interview, preparation, cli, aws, kubernetes, docker, terraform, cicd",
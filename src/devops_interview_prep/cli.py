@@ -4,17 +4,41 @@ DevOps Interview Prep CLI - Main entry point
 """
 from .core.logger import get_logger
 import click
+import importlib
 from .core.config import APP_NAME, VERSION
 
-# Import all commands
-from .commands.practice import practice
-from .commands.analytics import analytics, weak_areas
-from .commands.review import review_mistakes
-from .commands.interview import interview
-from .commands.info import stats, topics, quick
+# Command name -> "module:attribute", imported only when the command is used
+LAZY_COMMANDS = {
+    'practice': 'devops_interview_prep.commands.practice:practice',
+    'weak-areas': 'devops_interview_prep.commands.analytics:weak_areas',
+    'review-mistakes': 'devops_interview_prep.commands.review:review_mistakes',
+    'analytics': 'devops_interview_prep.commands.analytics:analytics',
+    'interview': 'devops_interview_prep.commands.interview:interview',
+    'stats': 'devops_interview_prep.commands.info:stats',
+    'topics': 'devops_interview_prep.commands.info:topics',
+    'quick': 'devops_interview_prep.commands.info:quick',
+}
 
 
-@click.group(context_settings=dict(
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules on first use"""
+    
+    def __init__(self, *args, lazy_commands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
+    
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+    
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            module_name, attr = self.lazy_commands[cmd_name].split(':')
+            command = getattr(importlib.import_module(module_name), attr)
+            self.add_command(command, cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(cls=LazyGroup, lazy_commands=LAZY_COMMANDS, context_settings=dict(
         ignore_unknown_options=True,
         allow_extra_args=True
 ))
@@ -44,16 +68,5 @@ def cli(ctx, verbose):
 
 
 
-# Add all commands to the CLI group
-cli.add_command(practice)
-cli.add_command(weak_areas)
-cli.add_command(review_mistakes)
-cli.add_command(analytics)
-cli.add_command(interview)
-cli.add_command(stats)
-cli.add_command(topics)
-cli.add_command(quick)
-
-
 if __name__ == '__main__':
     cli()
\ No newline at end of file
@@ -1,4 +1,4 @@
 """
 CLI commands
 """
-# Commands are imported directly in cli.py
+# Commands are imported on demand by cli.LazyGroup via LAZY_COMMANDS
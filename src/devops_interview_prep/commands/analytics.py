@@ -1,10 +1,10 @@
 """
 Analytics and weak areas commands
 """
-import json
 import click
-from ..core.progress_tracker import progress_tracker
-from ..core.question_bank import question_bank
+from ..core.progress_tracker import get_progress_tracker
+from ..core.question_bank import get_question_bank
+from ..utils.json_utils import dumps
 from ..utils.formatting import (
     print_analytics_summary, 
     print_topic_stats, 
@@ -21,16 +21,16 @@ def analytics(ctx, topic, export):
     """📈 Show detailed performance analytics"""
     log = ctx.obj['LOGGER']
     log.debug(f"Analytics called with topic={topic}, export={export}")
-    results = progress_tracker.results
-    
-    if not results:
+    progress_tracker = get_progress_tracker()
+    if not progress_tracker.results:
         click.echo("📊 No performance data available yet.")
         click.echo("💡 Practice some questions first to see your analytics!")
         return
     
+    topic_stats = progress_tracker.get_topic_stats()
     if topic:
-        results = [r for r in results if r.topic.lower() == topic.lower()]
-        if not results:
+        topic_lc = topic.lower()
+        if not any(t.lower() == topic_lc for t in topic_stats):
             click.echo(f"❌ No data found for topic: {topic}")
             return
     
@@ -39,7 +39,6 @@ def analytics(ctx, topic, export):
     print_analytics_summary(overall_stats)
     
     # Topic breakdown
-    topic_stats = progress_tracker.get_topic_stats()
     if topic_stats:
         print_topic_stats(topic_stats)
     
@@ -74,8 +73,8 @@ def _export_analytics(overall_stats, topic_stats, difficulty_stats, export_file)
     }
     
     try:
-        with open(export_file, 'w') as f:
-            json.dump(analytics_data, f, indent=2)
+        with open(export_file, 'wb') as f:
+            f.write(dumps(analytics_data, indent=True))
         click.echo(f"\n📄 Analytics exported to {export_file}")
     except Exception as e:
         click.echo(f"❌ Error exporting analytics: {e}")
@@ -85,7 +84,7 @@ def _export_analytics(overall_stats, topic_stats, difficulty_stats, export_file)
 @click.pass_context
 def weak_areas(ctx):
     """🎯 Show topics where you need more practice"""
-    weak_areas = progress_tracker.get_weak_areas()
+    weak_areas = get_progress_tracker().get_weak_areas()
     log = ctx.obj['LOGGER']
     log.debug("Weak areas command called")
     
@@ -94,6 +93,7 @@ def weak_areas(ctx):
         click.echo("💡 Practice some questions first to see your weak areas!")
         
         # Suggest starting with a popular topic
+        question_bank = get_question_bank()
         if question_bank.questions:
             topics = question_bank.get_topics()
             suggested_topic = topics[0] if topics else None
@@ -2,10 +2,10 @@
 Information commands (stats, topics, quick)
 """
 import click
-from ..core.question_bank import question_bank
-from ..core.progress_tracker import progress_tracker
+from ..core.question_bank import get_question_bank
+from ..core.progress_tracker import get_progress_tracker
 from ..models.session import InterviewSession
-from ..utils.formatting import print_header
+from ..utils.formatting import format_header
 
 
 @click.command(context_settings={"ignore_unknown_options": True})
@@ -14,6 +14,7 @@ def stats(ctx):
     """📊 Show question bank and progress statistics"""
     log = ctx.obj['LOGGER']
     log.debug("Stats command called")
+    question_bank = get_question_bank()
     if not question_bank.questions:
         click.echo("❌ No questions available")
         return
@@ -23,37 +24,42 @@ def stats(ctx):
     difficulty_dist = question_bank.get_difficulty_distribution()
     
     # Question bank stats
-    print_header("QUESTION BANK STATISTICS")
-    click.echo(f"📝 Total questions: {total}")
-    click.echo(f"📚 Topics: {len(topics)}")
+    lines = [
+        format_header("QUESTION BANK STATISTICS"),
+        f"📝 Total questions: {total}",
+        f"📚 Topics: {len(topics)}",
+    ]
     
     # Difficulty breakdown
-    click.echo(f"\n🎚️  By difficulty:")
-    for difficulty in ['easy', 'medium', 'hard']:
-        if difficulty in difficulty_dist:
-            click.echo(f"  • {difficulty}: {difficulty_dist[difficulty]}")
+    lines.append(f"\n🎚️  By difficulty:")
+    lines.extend(
+        f"  • {difficulty}: {difficulty_dist[difficulty]}"
+        for difficulty in ['easy', 'medium', 'hard'] if difficulty in difficulty_dist
+    )
     
     # Topic breakdown
-    click.echo(f"\n📚 By topic:")
-    for topic in sorted(topics):
-        count = question_bank.get_topic_count(topic)
-        click.echo(f"  • {topic}: {count}")
+    lines.append(f"\n📚 By topic:")
+    lines.extend(f"  • {topic}: {question_bank.get_topic_count(topic)}" for topic in sorted(topics))
     
     # Progress statistics
+    progress_tracker = get_progress_tracker()
     overall_stats = progress_tracker.get_overall_stats()
     if overall_stats['total_attempted'] > 0:
-        click.echo(f"\n📈 YOUR PROGRESS:")
-        click.echo(f"  • Questions attempted: {overall_stats['total_attempted']}")
-        click.echo(f"  • Overall success rate: {overall_stats['success_rate']:.1%}")
-        
-        unique_attempted = len(set(r.question_id for r in progress_tracker.results))
-        remaining = total - unique_attempted
-        click.echo(f"  • Questions remaining: {remaining}")
+        remaining = total - progress_tracker.get_attempted_count()
+        lines.extend([
+            f"\n📈 YOUR PROGRESS:",
+            f"  • Questions attempted: {overall_stats['total_attempted']}",
+            f"  • Overall success rate: {overall_stats['success_rate']:.1%}",
+            f"  • Questions remaining: {remaining}",
+        ])
+    
+    click.echo("\n".join(lines))
 
 
 @click.command(context_settings={"ignore_unknown_options": True})
 def topics():
     """📚 List all available interview topics"""
+    question_bank = get_question_bank()
     topics = question_bank.get_topics()
     company_types = question_bank.get_company_types()
     
@@ -61,21 +67,23 @@ def topics():
         click.echo("❌ No topics available")
         return
     
-    print_header("Available interview topics", "📚")
-    
-    for topic in topics:
-        count = question_bank.get_topic_count(topic)
-        difficulties = set(q.difficulty for q in question_bank.questions if q.topic == topic)
-        diff_str = ", ".join(sorted(difficulties))
-        click.echo(f"  • {topic}: {count} questions ({diff_str})")
+    lines = [format_header("Available interview topics", "📚")]
+    lines.extend(
+        f"  • {topic}: {question_bank.get_topic_count(topic)} questions "
+        f"({', '.join(question_bank.get_topic_difficulties(topic))})"
+        for topic in topics
+    )
     
     if company_types:
-        click.echo(f"\n🏢 Company types: {', '.join(company_types)}")
+        lines.append(f"\n🏢 Company types: {', '.join(company_types)}")
+    
+    click.echo("\n".join(lines))
 
 
 @click.command(context_settings={"ignore_unknown_options": True})
 def quick():
     """⚡ Get a single random question for quick practice"""
+    question_bank = get_question_bank()
     if not question_bank.questions:
         click.echo("❌ No questions available")
         return
@@ -90,6 +98,7 @@ def quick():
     
     session = InterviewSession()
     session.ask_question(question)
+    session.end()
     
     # Don't show full summary for quick practice
     click.echo(f"\n⚡ Quick result: {session.score}/{session.total}")
\ No newline at end of file
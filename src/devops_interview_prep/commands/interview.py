@@ -2,8 +2,9 @@
 Interview simulation command
 """
 import click
-import random as py_random
-from ..core.question_bank import question_bank
+from random import sample
+from collections import Counter
+from ..core.question_bank import get_question_bank
 from ..models.session import InterviewSession
 
 
@@ -17,19 +18,21 @@ def interview(ctx, count, company_type, duration, export):
     """🎭 Full interview simulation with mixed topics"""
     log = ctx.obj['LOGGER']
     log.debug(f"Interview called with count={count}, company_type={company_type}, duration={duration}")
+    question_bank = get_question_bank()
     if not question_bank.questions:
         click.echo("❌ Error: No questions available")
         return
     
-    all_questions = question_bank.questions
     if company_type:
-        all_questions = [q for q in all_questions if company_type.lower() in [tag.lower() for tag in (q.company_tags or [])]]
+        all_questions = question_bank.get_company_questions(company_type)
+    else:
+        all_questions = question_bank.questions
     
     if len(all_questions) < count:
         count = len(all_questions)
         click.echo(f"⚠️  Adjusted to {count} questions (all available)")
     
-    selected_questions = py_random.sample(all_questions, count)
+    selected_questions = sample(all_questions, count)
     
     click.echo("🎭 INTERVIEW SIMULATION")
     click.echo("="*30)
@@ -40,9 +43,7 @@ def interview(ctx, count, company_type, duration, export):
         click.echo(f"⏱️  Time limit: {duration}")
     
     # Show question distribution
-    topic_dist = {}
-    for q in selected_questions:
-        topic_dist[q.topic] = topic_dist.get(q.topic, 0) + 1
+    topic_dist = Counter(q.topic for q in selected_questions)
     
     click.echo(f"\n📊 Question distribution:")
     for topic, cnt in sorted(topic_dist.items()):
@@ -2,7 +2,7 @@
 Practice command implementation
 """
 import click
-from ..core.question_bank import question_bank
+from ..core.question_bank import get_question_bank
 from ..models.session import InterviewSession
 
 
@@ -19,6 +19,7 @@ def practice(ctx, topic, difficulty, count, company_type, interview_mode, export
     log = ctx.obj['LOGGER']
     log.debug(f"Practice called with topic={topic}, difficulty={difficulty}, count={count}, company_type={company_type}, interview_mode={interview_mode}")
     
+    question_bank = get_question_bank()
     if not question_bank.questions:
         click.echo("❌ Error: No questions available")
         return
@@ -29,7 +30,7 @@ def practice(ctx, topic, difficulty, count, company_type, interview_mode, export
         for t in topics:
             topic_count = question_bank.get_topic_count(t)
             click.echo(f"  • {t} ({topic_count} questions)")
-        topic = click.prompt("\nSelect a topic", type=click.Choice(topics, case_sensitive=False))
+        topic = click.prompt("\nSelect a topic", type=click.Choice(question_bank.get_topic_keys(), case_sensitive=False))
     
     questions = question_bank.get_questions(topic, difficulty, count, company_type)
     
@@ -37,7 +38,7 @@ def practice(ctx, topic, difficulty, count, company_type, interview_mode, export
         click.echo(f"❌ No questions found for the specified criteria")
         return
     
-    click.echo(f"\n🎯 Starting practice: {topic.upper()}")
+    click.echo(f"\n🎯 Starting practice: {questions[0].topic_upper}")
     if difficulty:
         click.echo(f"📊 Difficulty: {difficulty}")
     if company_type:
@@ -47,7 +48,7 @@ def practice(ctx, topic, difficulty, count, company_type, interview_mode, export
     session = InterviewSession()
     
     for i, question in enumerate(questions, 1):
-        click.echo(f"\n📋 Question {i}/{len(questions)} | {question.difficulty.upper()}")
+        click.echo(f"\n📋 Question {i}/{len(questions)} | {question.difficulty_upper}")
         session.ask_question(question)
         
         if interview_mode and i < len(questions):
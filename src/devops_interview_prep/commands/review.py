@@ -2,8 +2,9 @@
 Review mistakes command
 """
 import click
-from ..core.progress_tracker import progress_tracker
-from ..core.question_bank import question_bank
+from random import sample
+from ..core.progress_tracker import get_progress_tracker
+from ..core.question_bank import get_question_bank
 from ..models.session import InterviewSession
 from ..core.config import DEFAULT_REVIEW_COUNT
 
@@ -15,7 +16,7 @@ def review_mistakes(ctx, count):
     """🔄 Review questions you got wrong"""
     log = ctx.obj['LOGGER']
     log.debug(f"Review mistakes called with count={count}")
-    failed_ids = progress_tracker.get_failed_questions()
+    failed_ids = get_progress_tracker().get_failed_questions()
     
     if not failed_ids:
         click.echo("🎉 No incorrect answers found. Great job!")
@@ -26,7 +27,8 @@ def review_mistakes(ctx, count):
     
     # Limit the number of questions to review
     review_count = min(count, len(failed_ids))
-    questions = question_bank.get_questions(question_ids=failed_ids[:review_count])
+    review_ids = sample(list(failed_ids), review_count)
+    questions = get_question_bank().get_questions(question_ids=review_ids, count=review_count)
     
     if not questions:
         click.echo("❌ Could not find the failed questions")
@@ -35,12 +35,23 @@ def _get_questions_file_path():
 # File paths
 DEFAULT_QUESTIONS_FILE = _get_questions_file_path()
 PROGRESS_DIR = Path.home() / ".devops-ip"
-PROGRESS_FILE = PROGRESS_DIR / "progress.json"
+PROGRESS_FILE = PROGRESS_DIR / "progress.jsonl"
+LEGACY_PROGRESS_FILE = PROGRESS_DIR / "progress.json"
+CORRUPT_PROGRESS_FILE = PROGRESS_DIR / "progress.corrupt.log"
+# Byte offset in PROGRESS_FILE up to which unreadable lines have been logged
+CORRUPT_OFFSET_FILE = PROGRESS_DIR / "progress.corrupt.offset"
+QUESTIONS_CACHE_FILE = PROGRESS_DIR / "questions.cache.pkl"
 
 # Progress tracking settings
 MIN_ATTEMPTS_FOR_WEAK_AREAS = 3
 MAX_WEAK_AREAS_SHOWN = 5
 DEFAULT_REVIEW_COUNT = 10
+MAX_RESULTS_IN_MEMORY = 10000
+# Results are appended to PROGRESS_FILE in batches of this size. The buffer is
+# also flushed at session end, on an aborted prompt, at normal exit and on
+# SIGTERM/SIGHUP; only a hard kill (SIGKILL, power loss) can lose up to
+# FLUSH_EVERY - 1 unsaved answers.
+FLUSH_EVERY = 10
 
 # Performance thresholds
 EXCELLENT_THRESHOLD = 90
@@ -1,14 +1,28 @@
 """
 Progress tracking functionality
 """
-import json
+import os
+import sys
 import click
+import atexit
+import signal
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple
-from datetime import datetime
+from typing import Deque, Dict, FrozenSet, List, Optional, Set, Tuple
 
 from ..models.question import QuestionResult
-from .config import PROGRESS_FILE, MIN_ATTEMPTS_FOR_WEAK_AREAS, MAX_WEAK_AREAS_SHOWN
+from ..utils.json_utils import dumps, loads
+from .config import (
+    PROGRESS_FILE,
+    LEGACY_PROGRESS_FILE,
+    CORRUPT_PROGRESS_FILE,
+    CORRUPT_OFFSET_FILE,
+    MIN_ATTEMPTS_FOR_WEAK_AREAS,
+    MAX_WEAK_AREAS_SHOWN,
+    MAX_RESULTS_IN_MEMORY,
+    FLUSH_EVERY
+)
 
 
 class ProgressTracker:
@@ -17,123 +31,240 @@ class ProgressTracker:
     def __init__(self):
         self.results_file = PROGRESS_FILE
         self.results_file.parent.mkdir(exist_ok=True)
-        self.results = self._load_results()
+        self._migrate_legacy_results()
+        
+        # Encoded results not yet appended to the log, written by flush()
+        self._dirty_buffer: List[bytes] = []
+        atexit.register(self.flush)
+        self._install_signal_handlers()
+        
+        # Running aggregates over the full history, kept up to date by _record()
+        self._topic_counts: Dict[str, List[int]] = {}  # topic -> [correct, total]
+        self._difficulty_counts: Dict[str, List[int]] = {}
+        self._failed_ids: Set[str] = set()
+        self._attempted_ids: Set[str] = set()
+        self._n_correct = 0
+        self._n_total = 0
+        self._recent: Deque[bool] = deque(maxlen=10)  # correctness of the last answers
+        
+        # Derived stats by query name, cleared whenever a result is recorded.
+        # Getters hand out copies so callers can't alter the cached values.
+        self._stats_cache: Dict[str, object] = {}
+        
+        # Only the most recent results are kept in memory
+        self.results: Deque[QuestionResult] = deque(maxlen=MAX_RESULTS_IN_MEMORY)
+        self._load_results()
     
-    def _load_results(self) -> List[QuestionResult]:
-        """Load progress from file"""
+    def _migrate_legacy_results(self):
+        """Convert the old single-array progress.json into the JSON Lines log"""
+        if self.results_file.exists() or not LEGACY_PROGRESS_FILE.exists():
+            return
+        
+        # Build the new log beside the real one so a failed migration leaves
+        # no partial progress.jsonl behind to block the next attempt
+        tmp_file = self.results_file.with_name(self.results_file.name + '.tmp')
+        try:
+            data = loads(LEGACY_PROGRESS_FILE.read_bytes())
+            lines = [dumps(r) + b"\n" for r in data]
+            with open(tmp_file, 'wb') as f:
+                f.writelines(lines)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.results_file)
+        except Exception as e:
+            click.echo(f"⚠️  Warning: Could not migrate old progress file: {e}")
+        finally:
+            tmp_file.unlink(missing_ok=True)
+    
+    @staticmethod
+    def _parse_line(line: bytes) -> Optional[QuestionResult]:
+        """Parse one progress record, or return None if it is unreadable"""
+        try:
+            return QuestionResult.from_dict(loads(line))
+        except (ValueError, KeyError, TypeError):
+            return None
+    
+    def _load_results(self):
+        """Load progress from file, skipping unreadable lines"""
         if not self.results_file.exists():
-            return []
+            return
         
+        logged_offset = self._read_corrupt_offset()
+        new_corrupt_lines = []
+        offset = 0
         try:
-            with open(self.results_file, 'r') as f:
-                data = json.load(f)
-            return [
-                QuestionResult(
-                    question_id=r['question_id'],
-                    topic=r['topic'], 
-                    difficulty=r['difficulty'],
-                    correct=r['correct'],
-                    timestamp=datetime.fromisoformat(r['timestamp']),
-                    time_taken=r.get('time_taken')
-                )
-                for r in data
-            ]
-        except Exception:
-            return []
+            with open(self.results_file, 'rb') as f:
+                for line in f:
+                    line_offset = offset
+                    offset += len(line)
+                    if not line.strip():
+                        continue
+                    result = self._parse_line(line)
+                    if result is None:
+                        if line_offset >= logged_offset:
+                            new_corrupt_lines.append(line)
+                        continue
+                    self.results.append(result)
+                    self._record(result)
+        except OSError as e:
+            click.echo(f"⚠️  Warning: Could not read progress file: {e}")
+            return
+        
+        if new_corrupt_lines:
+            self._log_corrupt_lines(new_corrupt_lines, offset)
+    
+    def _read_corrupt_offset(self) -> int:
+        """Get how far into the progress log unreadable lines have been logged"""
+        try:
+            logged_offset = int(CORRUPT_OFFSET_FILE.read_text())
+        except (OSError, ValueError):
+            return 0
+        # A log shorter than the offset has been replaced, so start over
+        return logged_offset if logged_offset <= self.results_file.stat().st_size else 0
+    
+    def _log_corrupt_lines(self, corrupt_lines: List[bytes], offset: int):
+        """Record unreadable lines in the corrupt log, once per line"""
+        try:
+            with open(CORRUPT_PROGRESS_FILE, 'ab') as f:
+                f.writelines(line if line.endswith(b"\n") else line + b"\n" for line in corrupt_lines)
+            CORRUPT_OFFSET_FILE.write_text(str(offset))
+        except OSError as e:
+            click.echo(f"⚠️  Warning: Could not log unreadable progress entries: {e}")
+            return
+        click.echo(f"⚠️  Warning: Skipped {len(corrupt_lines)} unreadable progress "
+                   f"entries (copied to {CORRUPT_PROGRESS_FILE})")
+    
+    def _install_signal_handlers(self):
+        """Flush buffered results when the terminal closes or the process is stopped"""
+        def handle(signum, frame):
+            self.flush()
+            sys.exit(128 + signum)
+        
+        for name in ('SIGTERM', 'SIGHUP'):
+            signum = getattr(signal, name, None)  # SIGHUP does not exist on Windows
+            if signum is None:
+                continue
+            try:
+                signal.signal(signum, handle)
+            except ValueError:
+                pass  # Not the main thread; atexit and explicit flushes still apply
+    
+    def flush(self):
+        """Append buffered results to the progress log"""
+        if not self._dirty_buffer:
+            return
+        try:
+            with open(self.results_file, 'a+b') as f:
+                # Terminate a torn last line so it can't swallow the next record
+                if f.seek(0, os.SEEK_END) > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        f.write(b"\n")
+                f.writelines(self._dirty_buffer)
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError as e:
+            click.echo(f"⚠️  Warning: Could not save progress: {e}")
+            return
+        self._dirty_buffer.clear()
+    
+    def _record(self, result: QuestionResult):
+        """Fold a result into the running aggregates"""
+        self._stats_cache.clear()
+        topic_counts = self._topic_counts.setdefault(result.topic, [0, 0])
+        difficulty_counts = self._difficulty_counts.setdefault(result.difficulty, [0, 0])
+        topic_counts[1] += 1
+        difficulty_counts[1] += 1
+        self._n_total += 1
+        self._recent.append(result.correct)
+        self._attempted_ids.add(result.question_id)
+        if result.correct:
+            topic_counts[0] += 1
+            difficulty_counts[0] += 1
+            self._n_correct += 1
+        else:
+            self._failed_ids.add(result.question_id)
     
     def save_result(self, result: QuestionResult):
         """Save a new result"""
         self.results.append(result)
-        try:
-            with open(self.results_file, 'w') as f:
-                json.dump([
-                    {
-                        'question_id': r.question_id,
-                        'topic': r.topic,
-                        'difficulty': r.difficulty,
-                        'correct': r.correct,
-                        'timestamp': r.timestamp.isoformat(),
-                        'time_taken': r.time_taken
-                    }
-                    for r in self.results
-                ], f, indent=2)
-        except Exception as e:
-            click.echo(f"⚠️  Warning: Could not save progress: {e}")
+        self._record(result)
+        self._dirty_buffer.append(dumps(result.to_dict()) + b"\n")
+        if len(self._dirty_buffer) >= FLUSH_EVERY:
+            self.flush()
     
     def get_weak_areas(self) -> List[Tuple[str, float]]:
         """Get topics with lowest success rates"""
-        topic_stats = {}
-        for result in self.results:
-            if result.topic not in topic_stats:
-                topic_stats[result.topic] = {'correct': 0, 'total': 0}
-            topic_stats[result.topic]['total'] += 1
-            if result.correct:
-                topic_stats[result.topic]['correct'] += 1
-        
-        weak_areas = []
-        for topic, stats in topic_stats.items():
-            if stats['total'] >= MIN_ATTEMPTS_FOR_WEAK_AREAS:
-                success_rate = stats['correct'] / stats['total']
-                weak_areas.append((topic, success_rate))
-        
-        return sorted(weak_areas, key=lambda x: x[1])[:MAX_WEAK_AREAS_SHOWN]
+        if not self._n_total:
+            return []
+        if 'weak' not in self._stats_cache:
+            weak_areas = [
+                (topic, correct / total)
+                for topic, (correct, total) in self._topic_counts.items()
+                if total >= MIN_ATTEMPTS_FOR_WEAK_AREAS
+            ]
+            self._stats_cache['weak'] = sorted(weak_areas, key=lambda x: x[1])[:MAX_WEAK_AREAS_SHOWN]
+        return list(self._stats_cache['weak'])
     
-    def get_failed_questions(self) -> List[str]:
+    def get_failed_questions(self) -> FrozenSet[str]:
         """Get IDs of questions that were answered incorrectly"""
-        failed = []
-        for result in self.results:
-            if not result.correct:
-                failed.append(result.question_id)
-        return list(set(failed))
+        return frozenset(self._failed_ids)
+    
+    def get_attempted_count(self) -> int:
+        """Get the number of distinct questions attempted"""
+        return len(self._attempted_ids)
     
     def get_topic_stats(self) -> dict:
         """Get performance statistics by topic"""
-        topic_stats = {}
-        for result in self.results:
-            if result.topic not in topic_stats:
-                topic_stats[result.topic] = {'correct': 0, 'total': 0}
-            topic_stats[result.topic]['total'] += 1
-            if result.correct:
-                topic_stats[result.topic]['correct'] += 1
-        return topic_stats
+        if not self._n_total:
+            return {}
+        if 'topic' not in self._stats_cache:
+            self._stats_cache['topic'] = {
+                topic: {'correct': correct, 'total': total}
+                for topic, (correct, total) in self._topic_counts.items()
+            }
+        return {topic: dict(stats) for topic, stats in self._stats_cache['topic'].items()}
     
     def get_difficulty_stats(self) -> dict:
         """Get performance statistics by difficulty"""
-        difficulty_stats = {}
-        for result in self.results:
-            if result.difficulty not in difficulty_stats:
-                difficulty_stats[result.difficulty] = {'correct': 0, 'total': 0}
-            difficulty_stats[result.difficulty]['total'] += 1
-            if result.correct:
-                difficulty_stats[result.difficulty]['correct'] += 1
-        return difficulty_stats
+        if not self._n_total:
+            return {}
+        if 'difficulty' not in self._stats_cache:
+            self._stats_cache['difficulty'] = {
+                difficulty: {'correct': correct, 'total': total}
+                for difficulty, (correct, total) in self._difficulty_counts.items()
+            }
+        return {difficulty: dict(stats) for difficulty, stats in self._stats_cache['difficulty'].items()}
     
     def get_overall_stats(self) -> dict:
         """Get overall performance statistics"""
-        if not self.results:
+        if not self._n_total:
             return {
                 'total_attempted': 0,
                 'total_correct': 0,
                 'success_rate': 0,
                 'recent_success_rate': 0
             }
+        if 'overall' in self._stats_cache:
+            return dict(self._stats_cache['overall'])
         
-        total_attempted = len(self.results)
-        total_correct = sum(1 for r in self.results if r.correct)
+        total_attempted = self._n_total
+        total_correct = self._n_correct
         success_rate = total_correct / total_attempted
         
         # Recent performance (last 10 questions)
-        recent_results = self.results[-10:]
-        recent_correct = sum(1 for r in recent_results if r.correct)
-        recent_success_rate = recent_correct / len(recent_results) if recent_results else 0
+        recent_success_rate = sum(self._recent) / len(self._recent)
         
-        return {
+        self._stats_cache['overall'] = {
             'total_attempted': total_attempted,
             'total_correct': total_correct,
             'success_rate': success_rate,
             'recent_success_rate': recent_success_rate
         }
+        return dict(self._stats_cache['overall'])
 
 
-# Global instance
-progress_tracker = ProgressTracker()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_progress_tracker() -> ProgressTracker:
+    """Get the shared progress tracker, loading history on first use"""
+    return ProgressTracker()
\ No newline at end of file
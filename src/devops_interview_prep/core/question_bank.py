@@ -1,110 +1,224 @@
 """
 Question bank management
 """
-import json
+import os
 import click
-import random as py_random
+import heapq
+import logging
+import pickle
+import sys
+from functools import lru_cache
+from random import choice, random, sample
+from collections import Counter, defaultdict
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from ..models.question import Question
-from .config import DEFAULT_QUESTIONS_FILE
+from ..utils.json_utils import loads
+from .config import DEFAULT_QUESTIONS_FILE, QUESTIONS_CACHE_FILE
+
+# Bump whenever the pickled Question layout changes so stale caches are ignored
+CACHE_VERSION = 4
+
+# Question only uses __slots__ on Python 3.10+, and pickles of the two layouts
+# are not interchangeable, so the layout is part of the cache key
+_QUESTION_SLOTTED = '__slots__' in vars(Question)
+
+# Below this many requested questions, sample while filtering instead of
+# materializing the full filtered list
+RESERVOIR_SAMPLE_MAX = 32
+
+logger = logging.getLogger(__name__)
 
 
 class InterviewQuestionBank:
     """Manages the collection of interview questions"""
     
-    def __init__(self, questions_file: str = DEFAULT_QUESTIONS_FILE):
+    def __init__(self, questions_file: str = DEFAULT_QUESTIONS_FILE,
+                 cache_file: Optional[Path] = QUESTIONS_CACHE_FILE):
         self.questions_file = Path(questions_file)
+        self.cache_file = Path(cache_file) if cache_file else None
         self.questions: List[Question] = []
+        self._build_indexes()
         self.load_questions()
     
     def load_questions(self):
         """Load interview questions from JSON file"""
-        if not self.questions_file.exists():
-            click.echo(f"❌ Error: Questions file not found: {self.questions_file}")
-            return
-        
         try:
-            with open(self.questions_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            cache_key = self._cache_key()
+            questions = self._load_cache(cache_key)
+            if questions is None:
+                data = loads(self.questions_file.read_bytes())
+                questions = [Question.from_dict(q_data) for q_data in data.get('questions', [])]
+                self._save_cache(cache_key, questions)
             
-            self.questions = []
-            for q_data in data.get('questions', []):
-                question = Question(
-                    id=q_data['id'],
-                    topic=q_data['topic'],
-                    difficulty=q_data['difficulty'],
-                    question=q_data['question'],
-                    options=q_data['options'],
-                    correct_answer=q_data['correct_answer'],
-                    explanation=q_data['explanation'],
-                    scenario=q_data.get('scenario'),
-                    company_tags=q_data.get('company_tags', []),
-                    real_world_context=q_data.get('real_world_context')
-                )
-                self.questions.append(question)
-            
-            click.echo(f"✅ Loaded {len(self.questions)} interview questions")
+            self.questions = questions
+            self._build_indexes()
+            logger.debug(f"Loaded {len(self.questions)} interview questions")
+        except FileNotFoundError:
+            click.echo(f"❌ Error: Questions file not found: {self.questions_file}")
         except Exception as e:
             click.echo(f"❌ Error loading questions: {e}")
     
+    def _cache_key(self) -> tuple:
+        """Identify the interpreter, Question layout and questions file the cache was built from"""
+        stat = self.questions_file.stat()
+        return (CACHE_VERSION, sys.version_info[:2], _QUESTION_SLOTTED,
+                str(self.questions_file.resolve()), stat.st_mtime_ns, stat.st_size)
+    
+    def _load_cache(self, cache_key: tuple) -> Optional[List[Question]]:
+        """Load previously parsed questions if the cache matches the JSON file"""
+        if not self.cache_file:
+            return None
+        try:
+            with open(self.cache_file, 'rb') as f:
+                cached_key, questions = pickle.load(f)
+        except Exception:
+            return None
+        if cached_key != cache_key or not self._is_valid_cache(questions):
+            return None
+        return questions
+    
+    @staticmethod
+    def _is_valid_cache(questions) -> bool:
+        """Check that unpickled data really is a list of well-formed questions"""
+        if not isinstance(questions, list):
+            return False
+        try:
+            return all(
+                isinstance(q, Question)
+                and isinstance(q.id, str)
+                and q.topic_lc == q.topic.lower()
+                and q.correct_answer_idx == q.correct_answer - 1
+                for q in questions
+            )
+        except Exception:
+            return False
+    
+    def _save_cache(self, cache_key: tuple, questions: List[Question]):
+        """Write parsed questions to the cache, ignoring failures"""
+        if not self.cache_file:
+            return
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_suffix('.tmp')
+            with open(tmp_file, 'wb') as f:
+                pickle.dump((cache_key, questions), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, self.cache_file)
+        except Exception:
+            pass
+    
+    def _build_indexes(self):
+        """Precompute topic/difficulty metadata (questions don't change after load)"""
+        self._topic_counts = Counter(q.topic for q in self.questions)
+        self._difficulty_counts = Counter(q.difficulty for q in self.questions)
+        self._topics = sorted(self._topic_counts)
+        self._difficulties = sorted(self._difficulty_counts)
+        
+        topic_difficulties = defaultdict(set)
+        for q in self.questions:
+            topic_difficulties[q.topic].add(q.difficulty)
+        self._topic_difficulties = {
+            topic: sorted(difficulties) for topic, difficulties in topic_difficulties.items()
+        }
+        
+        # Lowercase-keyed buckets so case-insensitive filtering is a dict lookup
+        self._by_topic: Dict[str, List[Question]] = defaultdict(list)
+        self._by_difficulty: Dict[str, List[Question]] = defaultdict(list)
+        self._by_topic_diff: Dict[Tuple[str, str], List[Question]] = defaultdict(list)
+        self._by_company: Dict[str, List[Question]] = defaultdict(list)
+        self._by_id: Dict[str, Question] = {}
+        for q in self.questions:
+            self._by_topic[q.topic_lc].append(q)
+            self._by_difficulty[q.difficulty_lc].append(q)
+            self._by_topic_diff[(q.topic_lc, q.difficulty_lc)].append(q)
+            for company_key in q.company_tags_lc:
+                self._by_company[company_key].append(q)
+            self._by_id[q.id] = q
+        self._topic_keys = tuple(sorted(self._by_topic))
+        self._company_types = sorted({tag for q in self.questions for tag in (q.company_tags or ())})
+    
     def get_questions(self, topic: Optional[str] = None, difficulty: Optional[str] = None, 
                      count: int = 1, company_type: Optional[str] = None,
                      question_ids: Optional[List[str]] = None) -> List[Question]:
         """Get filtered questions based on criteria"""
-        filtered = self.questions
-        
+        # Start from the narrowest precomputed bucket
         if question_ids:
-            filtered = [q for q in filtered if q.id in question_ids]
-        
-        if topic:
-            filtered = [q for q in filtered if q.topic.lower() == topic.lower()]
-        
-        if difficulty:
-            filtered = [q for q in filtered if q.difficulty.lower() == difficulty.lower()]
+            filtered = [self._by_id[i] for i in question_ids if i in self._by_id]
+            if topic:
+                topic_lc = topic.lower()
+                filtered = [q for q in filtered if q.topic_lc == topic_lc]
+            if difficulty:
+                difficulty_lc = difficulty.lower()
+                filtered = [q for q in filtered if q.difficulty_lc == difficulty_lc]
+        elif topic and difficulty:
+            filtered = self._by_topic_diff.get((topic.lower(), difficulty.lower()), [])
+        elif topic:
+            filtered = self._by_topic.get(topic.lower(), [])
+        elif difficulty:
+            filtered = self._by_difficulty.get(difficulty.lower(), [])
+        elif company_type:
+            filtered = self._by_company.get(company_type.lower(), [])
+            company_type = None
+        else:
+            filtered = self.questions
         
         if company_type:
-            filtered = [q for q in filtered if company_type.lower() in [tag.lower() for tag in (q.company_tags or [])]]
+            company_type_lc = company_type.lower()
+            matches = (q for q in filtered if company_type_lc in q.company_tags_lc)
+            if count < RESERVOIR_SAMPLE_MAX:
+                # A-Res with equal weights: keep the count items with the largest random keys
+                return heapq.nlargest(count, matches, key=lambda _: random())
+            filtered = list(matches)
         
         if not filtered:
             return []
         
-        return py_random.sample(filtered, min(count, len(filtered)))
+        if count == 1:
+            return [choice(filtered)]
+        
+        return sample(filtered, min(count, len(filtered)))
     
     def get_topics(self) -> List[str]:
         """Get all available topics"""
-        return sorted(list(set(q.topic for q in self.questions)))
+        return self._topics
+    
+    def get_topic_keys(self) -> Tuple[str, ...]:
+        """Get lowercase topic keys, suitable for case-insensitive matching"""
+        return self._topic_keys
     
     def get_company_types(self) -> List[str]:
         """Get all available company types"""
-        company_types = set()
-        for q in self.questions:
-            if q.company_tags:
-                company_types.update(q.company_tags)
-        return sorted(list(company_types))
+        return self._company_types
+    
+    def get_company_questions(self, company_type: str) -> List[Question]:
+        """Get all questions tagged with a company type"""
+        return self._by_company.get(company_type.lower(), [])
     
     def get_difficulties(self) -> List[str]:
         """Get all available difficulty levels"""
-        return sorted(list(set(q.difficulty for q in self.questions)))
+        return self._difficulties
     
     def get_topic_count(self, topic: str) -> int:
         """Get number of questions for a specific topic"""
-        return len([q for q in self.questions if q.topic == topic])
+        return self._topic_counts[topic]
+    
+    def get_topic_difficulties(self, topic: str) -> List[str]:
+        """Get the difficulty levels available for a specific topic"""
+        return self._topic_difficulties.get(topic, [])
     
     def get_difficulty_distribution(self) -> dict:
         """Get distribution of questions by difficulty"""
-        distribution = {}
-        for q in self.questions:
-            distribution[q.difficulty] = distribution.get(q.difficulty, 0) + 1
-        return distribution
+        return dict(self._difficulty_counts)
     
     def get_random_question(self) -> Optional[Question]:
         """Get a random question"""
         if not self.questions:
             return None
-        return py_random.choice(self.questions)
+        return choice(self.questions)
 
 
-# Global instance
-question_bank = InterviewQuestionBank()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_question_bank() -> InterviewQuestionBank:
+    """Get the shared question bank, loading it on first use"""
+    return InterviewQuestionBank()
\ No newline at end of file
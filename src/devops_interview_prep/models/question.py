@@ -1,12 +1,16 @@
 """
 Question and QuestionResult models
 """
-from dataclasses import dataclass
-from typing import List, Optional
+import sys
+from dataclasses import dataclass, field
+from typing import FrozenSet, List, Optional
 from datetime import datetime
 
+# dataclass(slots=True) is only available on Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class Question:
     """Interview question model"""
     id: str
@@ -19,9 +23,40 @@ class Question:
     scenario: Optional[str] = None
     company_tags: Optional[List[str]] = None
     real_world_context: Optional[str] = None
+    # Display and matching forms, derived once in __post_init__
+    topic_upper: str = field(init=False, repr=False, compare=False)
+    difficulty_upper: str = field(init=False, repr=False, compare=False)
+    topic_lc: str = field(init=False, repr=False, compare=False)
+    difficulty_lc: str = field(init=False, repr=False, compare=False)
+    company_tags_lc: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    correct_answer_idx: int = field(init=False, repr=False, compare=False)  # 0-based
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'topic_upper', self.topic.upper())
+        object.__setattr__(self, 'difficulty_upper', self.difficulty.upper())
+        object.__setattr__(self, 'topic_lc', self.topic.lower())
+        object.__setattr__(self, 'difficulty_lc', self.difficulty.lower())
+        object.__setattr__(self, 'company_tags_lc', frozenset(tag.lower() for tag in (self.company_tags or ())))
+        object.__setattr__(self, 'correct_answer_idx', self.correct_answer - 1)
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "Question":
+        """Build a question from its JSON representation"""
+        return cls(
+            id=data['id'],
+            topic=data['topic'],
+            difficulty=data['difficulty'],
+            question=data['question'],
+            options=data['options'],
+            correct_answer=data['correct_answer'],
+            explanation=data['explanation'],
+            scenario=data.get('scenario'),
+            company_tags=data.get('company_tags', []),
+            real_world_context=data.get('real_world_context')
+        )
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class QuestionResult:
     """Result of answering a question"""
     question_id: str
@@ -29,4 +64,27 @@ class QuestionResult:
     difficulty: str
     correct: bool
     timestamp: datetime
-    time_taken: Optional[float] = None
\ No newline at end of file
+    time_taken: Optional[float] = None
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "QuestionResult":
+        """Build a result from its saved progress record"""
+        return cls(
+            question_id=data['question_id'],
+            topic=data['topic'],
+            difficulty=data['difficulty'],
+            correct=data['correct'],
+            timestamp=datetime.fromisoformat(data['timestamp']),
+            time_taken=data.get('time_taken')
+        )
+    
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable progress record"""
+        return {
+            'question_id': self.question_id,
+            'topic': self.topic,
+            'difficulty': self.difficulty,
+            'correct': self.correct,
+            'timestamp': self.timestamp.isoformat(),
+            'time_taken': self.time_taken
+        }
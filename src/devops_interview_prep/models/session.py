@@ -1,15 +1,16 @@
 """
 Interview session management
 """
-import json
+import time
 import click
-import random as py_random
+from random import shuffle
+from collections import defaultdict
 from datetime import datetime
-from dataclasses import asdict
 from typing import List
 
 from .question import Question, QuestionResult
-from ..core.progress_tracker import progress_tracker
+from ..core.progress_tracker import get_progress_tracker
+from ..utils.json_utils import dumps
 from ..utils.formatting import format_assessment, format_duration
 
 
@@ -19,80 +20,65 @@ class InterviewSession:
     def __init__(self, track_progress: bool = True):
         self.score = 0
         self.total = 0
-        self.start_time = datetime.now()
-        self.topic_performance = {}
+        self._t0 = time.monotonic()
+        # topic -> [correct, total]
+        self.topic_performance = defaultdict(lambda: [0, 0])
         self.track_progress = track_progress
         self.results = []
+        self.progress_tracker = get_progress_tracker() if track_progress else None
     
     def ask_question(self, question: Question) -> bool:
         """Ask an interview question and return if answer was correct"""
-        click.echo("\n" + "="*70)
+        lines = ["\n" + "="*70]
         
         if question.scenario:
-            click.echo(f"📋 Scenario: {question.scenario}")
-            click.echo()
+            lines.append(f"📋 Scenario: {question.scenario}\n")
         
-        click.echo(f"❓ Question: {question.question}")
-        click.echo()
+        lines.append(f"❓ Question: {question.question}\n")
         
         # Randomize answer options to make it more challenging
-        original_correct_answer = question.correct_answer
-        original_options = question.options.copy()
+        option_count = len(question.options)
+        perm = list(range(option_count))
+        shuffle(perm)
+        new_correct_position = perm.index(question.correct_answer_idx) + 1
         
-        options_with_correctness = [(option, i+1 == original_correct_answer) for i, option in enumerate(original_options)]
-        py_random.shuffle(options_with_correctness)
+        lines.extend(f"   {i}. {question.options[idx]}" for i, idx in enumerate(perm, 1))
+        lines.append("")
+        click.echo("\n".join(lines))
         
-        new_correct_position = None
-        shuffled_options = []
-        for i, (option_text, is_correct) in enumerate(options_with_correctness):
-            shuffled_options.append(option_text)
-            if is_correct:
-                new_correct_position = i + 1
+        question_start = time.monotonic()
         
-        for i, option in enumerate(shuffled_options, 1):
-            click.echo(f"   {i}. {option}")
-        
-        click.echo()
-        
-        question_start_time = datetime.now()
-        
-        while True:
-            try:
-                answer = click.prompt("Your answer (1-{})".format(len(shuffled_options)), type=int)
-                if 1 <= answer <= len(shuffled_options):
-                    break
-                else:
-                    click.echo(f"Please enter a number between 1 and {len(shuffled_options)}")
-            except click.Abort:
-                return False
-            except:
-                click.echo("Please enter a valid number")
+        try:
+            answer = click.prompt(f"Your answer (1-{option_count})", type=click.IntRange(1, option_count))
+        except click.Abort:
+            self.end()
+            return False
         
-        time_taken = (datetime.now() - question_start_time).total_seconds()
+        time_taken = time.monotonic() - question_start
         
         self.total += 1
         correct = answer == new_correct_position
         
         # Track topic performance
-        if question.topic not in self.topic_performance:
-            self.topic_performance[question.topic] = {'correct': 0, 'total': 0}
-        self.topic_performance[question.topic]['total'] += 1
+        perf = self.topic_performance[question.topic]
+        perf[1] += 1
         
         if correct:
             self.score += 1
-            self.topic_performance[question.topic]['correct'] += 1
-            click.echo("✅ Correct!")
+            perf[0] += 1
+            lines = ["✅ Correct!"]
         else:
-            correct_answer_text = original_options[original_correct_answer - 1]
-            click.echo(f"❌ Incorrect. Correct answer: {correct_answer_text}")
+            correct_answer_text = question.options[question.correct_answer_idx]
+            lines = [f"❌ Incorrect. Correct answer: {correct_answer_text}"]
         
-        click.echo(f"💡 Explanation: {question.explanation}")
+        lines.append(f"💡 Explanation: {question.explanation}")
         
         if question.real_world_context:
-            click.echo(f"🌍 Real-world context: {question.real_world_context}")
+            lines.append(f"🌍 Real-world context: {question.real_world_context}")
+        click.echo("\n".join(lines))
         
         # Save progress
-        if self.track_progress:
+        if self.progress_tracker:
             result = QuestionResult(
                 question_id=question.id,
                 topic=question.topic,
@@ -101,30 +87,39 @@ class InterviewSession:
                 timestamp=datetime.now(),
                 time_taken=time_taken
             )
-            progress_tracker.save_result(result)
+            self.progress_tracker.save_result(result)
             self.results.append(result)
         
         return correct
     
+    def end(self):
+        """Finish the session, making sure tracked progress is on disk"""
+        if self.progress_tracker:
+            self.progress_tracker.flush()
+    
     def show_summary(self):
         """Show interview session summary"""
-        duration = datetime.now() - self.start_time
+        self.end()
+        elapsed = time.monotonic() - self._t0
         percentage = (self.score / self.total * 100) if self.total > 0 else 0
         
-        click.echo("\n" + "="*50)
-        click.echo("📊 SESSION SUMMARY")
-        click.echo("="*50)
-        click.echo(f"Score: {self.score}/{self.total} ({percentage:.1f}%)")
-        click.echo(f"Duration: {format_duration(duration.seconds)}")
+        lines = [
+            "\n" + "="*50,
+            "📊 SESSION SUMMARY",
+            "="*50,
+            f"Score: {self.score}/{self.total} ({percentage:.1f}%)",
+            f"Duration: {format_duration(int(elapsed))}",
+        ]
         
         if self.topic_performance:
-            click.echo("\n📈 Performance by Topic:")
-            for topic, perf in sorted(self.topic_performance.items()):
-                topic_pct = (perf['correct'] / perf['total'] * 100) if perf['total'] > 0 else 0
-                click.echo(f"  {topic}: {perf['correct']}/{perf['total']} ({topic_pct:.0f}%)")
-        
-        click.echo(f"\n🎯 Assessment:")
-        click.echo(format_assessment(percentage))
+            lines.append("\n📈 Performance by Topic:")
+            for topic, (correct, total) in sorted(self.topic_performance.items()):
+                topic_pct = (correct / total * 100) if total > 0 else 0
+                lines.append(f"  {topic}: {correct}/{total} ({topic_pct:.0f}%)")
+        
+        lines.append(f"\n🎯 Assessment:")
+        lines.append(format_assessment(percentage))
+        click.echo("\n".join(lines))
     
     def export_results(self, filename: str):
         """Export session results to JSON file"""
@@ -138,13 +133,13 @@ class InterviewSession:
                     'score': self.score,
                     'total': self.total,
                     'percentage': (self.score / self.total * 100) if self.total > 0 else 0,
-                    'duration_seconds': (datetime.now() - self.start_time).total_seconds()
+                    'duration_seconds': time.monotonic() - self._t0
                 },
-                'results': [asdict(r) for r in self.results]
+                'results': self.results
             }
             
-            with open(filename, 'w') as f:
-                json.dump(export_data, f, indent=2, default=str)
+            with open(filename, 'wb') as f:
+                f.write(dumps(export_data, indent=True))
             click.echo(f"📄 Results exported to {filename}")
         except Exception as e:
             click.echo(f"❌ Error exporting results: {e}")
\ No newline at end of file
@@ -13,6 +13,15 @@ from ..core.config import (
 )
 
 
+# Assessment messages, checked from the highest threshold down
+_ASSESSMENTS = (
+    (EXCELLENT_THRESHOLD, "🏆 Excellent! You're interview-ready."),
+    (GOOD_THRESHOLD, "🎉 Great work! You're well-prepared."),
+    (FAIR_THRESHOLD, "👍 Good progress. Focus on weak areas."),
+)
+_DEFAULT_ASSESSMENT = "📚 More preparation needed. Keep practicing!"
+
+
 def format_separator(length: int = SEPARATOR_LENGTH) -> str:
     """Create a separator line"""
     return "=" * length
@@ -35,14 +44,8 @@ def get_performance_emoji(success_rate: float) -> str:
 
 def format_assessment(percentage: float) -> str:
     """Get assessment message based on score"""
-    if percentage >= EXCELLENT_THRESHOLD:
-        return "🏆 Excellent! You're interview-ready."
-    elif percentage >= GOOD_THRESHOLD:
-        return "🎉 Great work! You're well-prepared."
-    elif percentage >= FAIR_THRESHOLD:
-        return "👍 Good progress. Focus on weak areas."
-    else:
-        return "📚 More preparation needed. Keep practicing!"
+    return next((message for threshold, message in _ASSESSMENTS if percentage >= threshold),
+                _DEFAULT_ASSESSMENT)
 
 
 def format_duration(seconds: int) -> str:
@@ -52,10 +55,14 @@ def format_duration(seconds: int) -> str:
     return f"{minutes}m {remaining_seconds}s"
 
 
+def format_header(title: str, emoji: str = "📊") -> str:
+    """Create a formatted header with its underline"""
+    return f"{emoji} {title.upper()}\n{format_separator(len(title) + 5)}"
+
+
 def print_header(title: str, emoji: str = "📊"):
     """Print a formatted header"""
-    click.echo(f"{emoji} {title.upper()}")
-    click.echo(format_separator(len(title) + 5))
+    click.echo(format_header(title, emoji))
 
 
 def print_section_header(title: str):
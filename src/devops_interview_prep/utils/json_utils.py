@@ -0,0 +1,35 @@
+"""
+JSON helpers - use orjson when it is installed, stdlib json otherwise
+
+Both backends serialize dataclasses and datetimes (as ISO 8601) directly.
+"""
+try:
+    import orjson
+
+    def loads(data):
+        """Parse JSON from bytes or str"""
+        return orjson.loads(data)
+
+    def dumps(obj, indent: bool = False) -> bytes:
+        """Serialize to UTF-8 encoded JSON bytes"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+except ImportError:
+    import json
+    from dataclasses import fields, is_dataclass
+    from datetime import datetime
+
+    def _default(obj):
+        """Match orjson's handling of the types it serializes natively"""
+        if is_dataclass(obj):
+            return {f.name: getattr(obj, f.name) for f in fields(obj)}
+        if isinstance(obj, datetime):
+            return obj.isoformat()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def loads(data):
+        """Parse JSON from bytes or str"""
+        return json.loads(data)
+
+    def dumps(obj, indent: bool = False) -> bytes:
+        """Serialize to UTF-8 encoded JSON bytes"""
+        return json.dumps(obj, indent=2 if indent else None, default=_default).encode('utf-8')
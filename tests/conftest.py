@@ -13,3 +13,19 @@ def sample_questions_file():
 def temp_progress_dir(tmp_path):
     """Provide temporary directory for progress tracking tests"""
     return tmp_path / ".devops-ip-test"
+
+@pytest.fixture
+def progress_paths(temp_progress_dir, monkeypatch):
+    """Point the progress tracker's files at a temporary directory"""
+    from devops_interview_prep.core import progress_tracker
+
+    temp_progress_dir.mkdir()
+    paths = {
+        'PROGRESS_FILE': temp_progress_dir / "progress.jsonl",
+        'LEGACY_PROGRESS_FILE': temp_progress_dir / "progress.json",
+        'CORRUPT_PROGRESS_FILE': temp_progress_dir / "progress.corrupt.log",
+        'CORRUPT_OFFSET_FILE': temp_progress_dir / "progress.corrupt.offset",
+    }
+    for name, path in paths.items():
+        monkeypatch.setattr(progress_tracker, name, path)
+    return paths
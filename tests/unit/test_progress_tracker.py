@@ -0,0 +1,101 @@
+"""
+Tests for progress persistence: legacy migration, buffered writes and
+corrupt-line handling
+"""
+import json
+from datetime import datetime
+
+from devops_interview_prep.core.config import FLUSH_EVERY
+from devops_interview_prep.core.progress_tracker import ProgressTracker
+from devops_interview_prep.models import session as session_module
+from devops_interview_prep.models.question import QuestionResult
+from devops_interview_prep.models.session import InterviewSession
+
+
+def make_result(question_id="aws-001", correct=True):
+    return QuestionResult(
+        question_id=question_id,
+        topic="aws",
+        difficulty="easy",
+        correct=correct,
+        timestamp=datetime(2024, 1, 1, 12, 0, 0),
+        time_taken=1.5
+    )
+
+
+def read_lines(path):
+    return path.read_bytes().splitlines()
+
+
+def test_migrates_legacy_progress_json(progress_paths):
+    legacy = [make_result("aws-001").to_dict(), make_result("aws-002", correct=False).to_dict()]
+    progress_paths['LEGACY_PROGRESS_FILE'].write_text(json.dumps(legacy))
+
+    tracker = ProgressTracker()
+
+    assert [r.question_id for r in tracker.results] == ["aws-001", "aws-002"]
+    assert [json.loads(line) for line in read_lines(progress_paths['PROGRESS_FILE'])] == legacy
+    assert progress_paths['LEGACY_PROGRESS_FILE'].exists()
+    assert tracker.get_failed_questions() == frozenset({"aws-002"})
+
+
+def test_failed_migration_leaves_no_partial_log(progress_paths):
+    progress_paths['LEGACY_PROGRESS_FILE'].write_text('[{"question_id": "aws-001"')
+
+    tracker = ProgressTracker()
+
+    assert not tracker.results
+    assert not progress_paths['PROGRESS_FILE'].exists()
+    assert list(progress_paths['PROGRESS_FILE'].parent.glob("*.tmp")) == []
+    assert progress_paths['LEGACY_PROGRESS_FILE'].exists()
+
+
+def test_results_are_buffered_until_flush_threshold(progress_paths):
+    tracker = ProgressTracker()
+
+    for i in range(FLUSH_EVERY - 1):
+        tracker.save_result(make_result(f"aws-{i:03d}"))
+    assert not progress_paths['PROGRESS_FILE'].exists()
+
+    tracker.save_result(make_result("aws-last"))
+    assert len(read_lines(progress_paths['PROGRESS_FILE'])) == FLUSH_EVERY
+
+
+def test_session_end_flushes_pending_results(progress_paths, monkeypatch):
+    tracker = ProgressTracker()
+    monkeypatch.setattr(session_module, 'get_progress_tracker', lambda: tracker)
+    session = InterviewSession()
+
+    tracker.save_result(make_result("aws-001"))
+    tracker.save_result(make_result("aws-002"))
+    assert not progress_paths['PROGRESS_FILE'].exists()
+
+    session.end()
+    assert len(read_lines(progress_paths['PROGRESS_FILE'])) == 2
+    assert [r.question_id for r in ProgressTracker().results] == ["aws-001", "aws-002"]
+
+
+def test_flush_terminates_torn_last_line(progress_paths):
+    progress_paths['PROGRESS_FILE'].write_bytes(b'{"question_id": "aws-0')
+    tracker = ProgressTracker()
+
+    tracker.save_result(make_result("aws-002"))
+    tracker.flush()
+
+    assert [r.question_id for r in ProgressTracker().results] == ["aws-002"]
+
+
+def test_corrupt_line_is_skipped_and_logged_once(progress_paths):
+    good = [json.dumps(make_result(f"aws-00{i}").to_dict()).encode() for i in (1, 2)]
+    contents = good[0] + b"\nnot json\n" + good[1] + b"\n"
+    progress_paths['PROGRESS_FILE'].write_bytes(contents)
+
+    tracker = ProgressTracker()
+
+    assert [r.question_id for r in tracker.results] == ["aws-001", "aws-002"]
+    assert progress_paths['PROGRESS_FILE'].read_bytes() == contents
+    assert read_lines(progress_paths['CORRUPT_PROGRESS_FILE']) == [b"not json"]
+
+    # A second load must not log the same line again
+    assert len(ProgressTracker().results) == 2
+    assert read_lines(progress_paths['CORRUPT_PROGRESS_FILE']) == [b"not json"]
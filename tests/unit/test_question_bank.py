@@ -0,0 +1,140 @@
+"""
+Tests for the question bank: parsed-questions cache and sampling
+"""
+import json
+import os
+import pickle
+import shutil
+
+import pytest
+
+from devops_interview_prep.core import question_bank
+from devops_interview_prep.core.question_bank import InterviewQuestionBank
+
+
+@pytest.fixture
+def questions_file(sample_questions_file, tmp_path):
+    """Copy of the sample questions that tests may touch"""
+    path = tmp_path / "questions.json"
+    shutil.copy(sample_questions_file, path)
+    return path
+
+
+@pytest.fixture
+def cache_file(tmp_path):
+    return tmp_path / "questions.cache.pkl"
+
+
+@pytest.fixture
+def json_parses(monkeypatch):
+    """Count how often the questions JSON is parsed"""
+    calls = []
+    real_loads = question_bank.loads
+
+    def counting_loads(data):
+        calls.append(data)
+        return real_loads(data)
+
+    monkeypatch.setattr(question_bank, 'loads', counting_loads)
+    return calls
+
+
+def test_cache_hit_skips_json_parse(questions_file, cache_file, json_parses):
+    first = InterviewQuestionBank(questions_file, cache_file)
+    assert cache_file.exists()
+    assert len(json_parses) == 1
+
+    second = InterviewQuestionBank(questions_file, cache_file)
+    assert len(json_parses) == 1
+    assert second.questions == first.questions
+
+
+def test_cache_miss_when_questions_file_changes(questions_file, cache_file, json_parses):
+    InterviewQuestionBank(questions_file, cache_file)
+    stat = questions_file.stat()
+    os.utime(questions_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    bank = InterviewQuestionBank(questions_file, cache_file)
+    assert len(json_parses) == 2
+    assert [q.id for q in bank.questions] == ["test-001"]
+
+
+@pytest.mark.parametrize("payload", [
+    {"test-001": "not a list"},
+    ["not a question"],
+    [{"id": "test-001", "topic": "AWS"}],
+])
+def test_mismatched_cache_payload_is_rejected(questions_file, cache_file, json_parses, payload):
+    probe = InterviewQuestionBank(questions_file, cache_file=None)
+    with open(cache_file, 'wb') as f:
+        pickle.dump((probe._cache_key(), payload), f)
+
+    bank = InterviewQuestionBank(questions_file, cache_file)
+    assert len(json_parses) == 2
+    assert [q.id for q in bank.questions] == ["test-001"]
+
+
+def test_cache_from_other_interpreter_is_rejected(questions_file, cache_file, json_parses):
+    bank = InterviewQuestionBank(questions_file, cache_file)
+    key = list(bank._cache_key())
+    key[1] = (2, 7)
+    with open(cache_file, 'wb') as f:
+        pickle.dump((tuple(key), bank.questions), f)
+
+    InterviewQuestionBank(questions_file, cache_file)
+    assert len(json_parses) == 2
+
+
+@pytest.fixture
+def tagged_bank(tmp_path):
+    """Bank of 40 questions, every fourth one tagged for FAANG"""
+    questions = [
+        {
+            "id": f"q-{i:03d}",
+            "topic": "aws",
+            "difficulty": "easy",
+            "question": f"Question {i}?",
+            "options": ["a", "b"],
+            "correct_answer": 1,
+            "explanation": "Because.",
+            "company_tags": ["faang"] if i % 4 == 0 else ["startup"]
+        }
+        for i in range(40)
+    ]
+    path = tmp_path / "tagged.json"
+    path.write_text(json.dumps({"questions": questions}))
+    return InterviewQuestionBank(path, cache_file=None)
+
+
+@pytest.mark.parametrize("count, expected", [(3, 3), (10, 10), (25, 10)])
+def test_company_reservoir_returns_distinct_tagged_questions(tagged_bank, count, expected):
+    assert count < question_bank.RESERVOIR_SAMPLE_MAX
+
+    questions = tagged_bank.get_questions(topic="aws", company_type="FAANG", count=count)
+
+    assert len(questions) == expected
+    assert len({q.id for q in questions}) == expected
+    assert all("faang" in q.company_tags_lc for q in questions)
+
+
+def test_large_company_request_uses_sample(tagged_bank, monkeypatch):
+    calls = []
+    real_sample = question_bank.sample
+
+    def spy_sample(population, k):
+        calls.append(k)
+        return real_sample(population, k)
+
+    def fail_nlargest(*args, **kwargs):
+        raise AssertionError("reservoir path used for a large request")
+
+    monkeypatch.setattr(question_bank, 'sample', spy_sample)
+    monkeypatch.setattr(question_bank.heapq, 'nlargest', fail_nlargest)
+
+    questions = tagged_bank.get_questions(
+        topic="aws", company_type="faang", count=question_bank.RESERVOIR_SAMPLE_MAX
+    )
+
+    assert calls == [10]
+    assert len({q.id for q in questions}) == 10
+    assert all("faang" in q.company_tags_lc for q in questions)